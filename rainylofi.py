@@ -1,11 +1,11 @@
-import subprocess
-import socket
-import os
 import time
-import json
+_LAUNCH_TIME = time.perf_counter() # startup profile clock; interpreter start-up is not included
+import os
 import sys
 import curses # For TUI
 import random
+# subprocess, socket, json and threading are only needed once audio starts, so they are
+# imported where first used to get the first frame on screen sooner.
 
 # --- Configuration ---
 LOFI_STREAM_URL = "https://www.youtube.com/watch?v=jfKfPfyJRdk"
@@ -34,7 +34,6 @@ RAIN_SPAWN_Y_PERCENT = 0.2
 
 # --- UI Layout Configuration ---
 TITLE_H = 1
-TRACK_INFO_H = 3
 TRACK_INFO_HLINE_H = 1
 DEFAULT_INSTRUCTIONS_AREA_H = 3
 FEEDBACK_H_IN_INSTRUCTIONS = 1
@@ -43,7 +42,32 @@ MIN_ANIMATION_H = 2
 MIN_FULL_UI_W = 70
 COLOR_PURPLE_CUSTOM_ID = 16
 
-SOUND_PRESETS = {
+VOLUME_STEP = 5
+RESERVED_KEYS = {'q', 'h'}
+
+# --- Track Registry Configuration ---
+# Layers are read from TRACKS_CONFIG_FILE when it exists; otherwise DEFAULT_TRACKS
+# and DEFAULT_PRESETS are used. See README for the file format.
+TRACKS_CONFIG_FILE = "./tracks.json"
+
+# Per-kind mpv behaviour: "stream" needs the internet, "loop" needs a local file.
+TRACK_KINDS = {
+    "stream": {"needs_internet": True, "needs_file": False, "socket_wait_retries": 30,
+               "mpv_args": ["--idle=yes", "--loop-file=no"]},
+    "loop": {"needs_internet": False, "needs_file": True, "socket_wait_retries": 20,
+             "mpv_args": ["--loop-file=inf"]},
+}
+
+DEFAULT_TRACKS = [
+    {"name": "lofi", "label": "Lofi", "source": LOFI_STREAM_URL, "kind": "stream", "volume": 50, "playing": True,
+     "keys": {"toggle": "l", "vol_up": "o", "vol_down": "k"}, "animation": "notes"},
+    {"name": "rain", "label": "Rain", "source": RAIN_SOUND_FILE, "kind": "loop", "volume": 50, "playing": False,
+     "keys": {"toggle": "r", "vol_up": "e", "vol_down": "d"}, "animation": "rain"},
+    {"name": "storm", "label": "Storm", "source": STORM_SOUND_FILE, "kind": "loop", "volume": 50, "playing": False,
+     "keys": {"toggle": "s", "vol_up": "t", "vol_down": "g"}, "animation": "lightning"},
+]
+
+DEFAULT_PRESETS = {
     '1': {"name": "Chill Focus", "settings": {
         "lofi": {"playing": True, "volume": 60}, "rain": {"playing": True, "volume": 30}, "storm": {"playing": False, "volume": 0}}},
     '2': {"name": "Study Storm", "settings": {
@@ -53,51 +77,207 @@ SOUND_PRESETS = {
     '0': {"name": "Silence All", "settings": {
         "lofi": {"playing": False, "volume": 0}, "rain": {"playing": False, "volume": 0}, "storm": {"playing": False, "volume": 0}}},
 }
-HELP_LINES_TEXT = [
-    "[L]ofi: Play/Pause  [O] Vol+  [K] Vol-",
-    "[R]ain: Play/Pause  [E] Vol+  [D] Vol-",
-    "[S]torm:Play/Pause  [T] Vol+  [G] Vol-",
-    "Presets: [1]Chill [2]Study [3]Lofi [0]Mute",
-    "[H]elp Toggle    [Q]uit Player"
-]
+SILENCE_PRESETS = {'0': {"name": "Silence All", "settings": {}}}
 HELP_DISPLAY_DURATION_FRAMES = 70
 
 PLAYER_TITLE = " ♪ Rainy Lofi ♪ "
 
+# --- Startup Profiling ---
+# Seconds from module load (interpreter start-up excluded) to each startup milestone; only the
+# first hit is kept. "first_audio" is when mpv first reports a track that was set to play at
+# launch as actually playing (core-idle false).
+_startup_marks = {}
+STARTUP_AUDIO_WAIT_S = 30
+
+def _mark_startup(milestone):
+    if milestone not in _startup_marks:
+        _startup_marks[milestone] = time.perf_counter() - _LAUNCH_TIME
+
+def report_startup_profile(mode, log_path=None):
+    ms = {k: round(_startup_marks[k] * 1000, 1) if k in _startup_marks else None for k in ("first_frame", "first_audio")}
+    fmt = lambda v: f"{v:.1f} ms" if v is not None else "n/a"
+    print(f"Startup profile ({mode}, from module load): first frame {fmt(ms['first_frame'])}, first audio (mpv playing) {fmt(ms['first_audio'])}")
+    if log_path:
+        import json
+        try:
+            with open(log_path, 'a') as f:
+                f.write(json.dumps({"time": int(time.time()), "mode": mode,
+                                    "first_frame_ms": ms["first_frame"], "first_audio_ms": ms["first_audio"]}) + "\n")
+        except OSError as e:
+            print(f"Error writing startup profile {log_path}:{e}")
+
+# --- Track Registry ---
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+def _build_track(entry):
+    if not isinstance(entry, dict):
+        raise ValueError(f"track {entry!r} must be an object")
+    name = entry.get("name")
+    if not name or not isinstance(name, str):
+        raise ValueError("every track needs a 'name'")
+    if not entry.get("source") or not isinstance(entry["source"], str):
+        raise ValueError(f"track '{name}' needs a 'source'")
+    label = entry.get("label", name.capitalize())
+    if not isinstance(label, str):
+        raise ValueError(f"track '{name}' has a non-text 'label'")
+    kind = entry.get("kind", "loop")
+    if not isinstance(kind, str) or kind not in TRACK_KINDS:
+        raise ValueError(f"track '{name}' has unknown kind '{kind}' (use {', '.join(TRACK_KINDS)})")
+    animation = entry.get("animation")
+    if animation is not None and (not isinstance(animation, str) or animation not in ANIMATION_HOOKS):
+        raise ValueError(f"track '{name}' has unknown animation '{animation}' (use {', '.join(ANIMATION_HOOKS)})")
+    volume = entry.get("volume", 50)
+    if not _is_number(volume):
+        raise ValueError(f"track '{name}' has a non-numeric 'volume'")
+    if not isinstance(entry.get("playing", False), bool):
+        raise ValueError(f"track '{name}' 'playing' must be true or false")
+    raw_keys = entry.get("keys", {})
+    if not isinstance(raw_keys, dict):
+        raise ValueError(f"track '{name}' 'keys' must be an object")
+    keys = {}
+    for act, k in raw_keys.items():
+        if act not in ("toggle", "vol_up", "vol_down"):
+            raise ValueError(f"track '{name}' has unknown key action '{act}'")
+        if k is None:
+            continue
+        if not isinstance(k, str) or len(k) != 1:
+            raise ValueError(f"track '{name}' key for '{act}' must be a single character")
+        keys[act] = k.lower()
+    return {"name": name, "label": label, "source": entry["source"], "kind": kind,
+            "volume": max(0, min(100, int(volume))), "playing": entry.get("playing", False),
+            "keys": keys, "animation": animation}
+
+def _build_preset(pkey, preset, by_name):
+    if not isinstance(preset, dict):
+        raise ValueError(f"preset '{pkey}' must be an object")
+    settings = preset.get("settings", {})
+    if not isinstance(settings, dict):
+        raise ValueError(f"preset '{pkey}' 'settings' must be an object")
+    for stype, setting in settings.items():
+        if stype not in by_name:
+            raise ValueError(f"preset '{pkey}' names unknown track '{stype}'")
+        if not isinstance(setting, dict):
+            raise ValueError(f"preset '{pkey}' setting for track '{stype}' must be an object")
+        if setting.get("volume") is not None and not _is_number(setting["volume"]):
+            raise ValueError(f"preset '{pkey}' has a non-numeric volume for track '{stype}'")
+        if not isinstance(setting.get("playing", False), bool):
+            raise ValueError(f"preset '{pkey}' 'playing' for track '{stype}' must be true or false")
+    name = preset.get("name", f"Preset {pkey}")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"preset '{pkey}' has an invalid 'name'")
+    # Tracks a preset does not mention are paused at their current volume (volume None).
+    return {"name": name,
+            "settings": [(stype, settings.get(stype, {}).get("playing", False),
+                          None if settings.get(stype, {}).get("volume") is None
+                          else max(0, min(100, int(settings[stype]["volume"]))))
+                         for stype in by_name]}
+
+KEY_ACTION_NAMES = {"toggle": "Play/Pause", "vol_up": "Vol+", "vol_down": "Vol-"}
+
+def _keys_hint(track, sep):
+    return sep.join(track["keys"][act].upper() for act in ("toggle", "vol_up", "vol_down") if act in track["keys"])
+
+def fit_text(variants, max_w):
+    """Returns the first of the precomputed variants (longest first) that fits in max_w columns."""
+    for text in variants:
+        if len(text) <= max_w:
+            return text
+    return variants[-1][:max(0, max_w)] if variants else ""
+
+def build_track_registry(track_entries, preset_entries):
+    if not isinstance(track_entries, list) or not track_entries:
+        raise ValueError("'tracks' must be a non-empty list")
+    if not isinstance(preset_entries, dict):
+        raise ValueError("'presets' must be an object")
+    tracks = [_build_track(e) for e in track_entries]
+    by_name = {}
+    for t in tracks:
+        if t["name"] in by_name:
+            raise ValueError(f"duplicate track name '{t['name']}'")
+        by_name[t["name"]] = t
+
+    # Preset keys are matched case-insensitively, like track keys.
+    presets = {}
+    for pkey, preset in preset_entries.items():
+        if len(pkey) != 1 or pkey.lower() in RESERVED_KEYS or pkey.lower() in presets:
+            raise ValueError(f"preset key '{pkey}' must be a single, unreserved, unique character")
+        presets[pkey.lower()] = _build_preset(pkey, preset, by_name)
+
+    # key -> (action, track name); built once so a keypress is a single dict lookup
+    keymap = {}
+    for t in tracks:
+        for act, k in t["keys"].items():
+            if k in RESERVED_KEYS or k in presets or k in keymap:
+                raise ValueError(f"key '{k}' for track '{t['name']}' is reserved or already bound")
+            keymap[k] = (act, t["name"])
+
+    # Animated tracks only, drawn back to front in ANIMATION_HOOKS order.
+    hook_order = list(ANIMATION_HOOKS)
+    animated = sorted(((t["name"], ANIMATION_HOOKS[t["animation"]]) for t in tracks if t["animation"]),
+                      key=lambda item: hook_order.index(by_name[item[0]]["animation"]))
+
+    # Footer hints, longest first; the UI draws the first variant that fits the terminal width.
+    keyed = [t for t in tracks if t["keys"]]
+    preset_short = " ".join(f"[{k.upper()}]{p['name'].split()[0]}" for k, p in presets.items())
+    preset_keys = "".join(f"[{k.upper()}]" for k in presets)
+    help_lines = [f"[{_keys_hint(t, '] [')}] {t['label']}: "
+                  + " ".join(desc for act, desc in KEY_ACTION_NAMES.items() if act in t["keys"]) for t in keyed]
+    if presets:
+        help_lines.append(f"Presets: {preset_short}")
+    help_lines.append("[H]elp Toggle    [Q]uit Player")
+    track_hint_sep = " " if keyed else ""
+
+    return {"tracks": tracks, "by_name": by_name, "keymap": keymap, "presets": presets, "animated": animated,
+            "label_w": max([7] + [len(t["label"]) for t in tracks]),
+            "help_lines": help_lines,
+            "main_instr_variants": [" ".join(f"[{_keys_hint(t, '/')}]{t['label']}" for t in keyed) + track_hint_sep + "[H]Help [Q]Quit",
+                                    " ".join(f"[{_keys_hint(t, '')}]{t['label']}" for t in keyed) + track_hint_sep + "[H]Help [Q]Quit",
+                                    "Keys:" + " ".join(_keys_hint(t, "") for t in keyed) + track_hint_sep + "H Q"],
+            "preset_instr_variants": [f"Presets: {preset_short}", f"Presets: {preset_keys}",
+                                      f"Presets({','.join(k.upper() for k in presets)})"] if presets else []}
+
+def load_track_registry(path=TRACKS_CONFIG_FILE):
+    if not os.path.exists(path):
+        return build_track_registry(DEFAULT_TRACKS, DEFAULT_PRESETS)
+    import json
+    with open(path) as f:
+        cfg = json.load(f)
+    if not isinstance(cfg, dict):
+        raise ValueError("expected an object with a 'tracks' list")
+    # The default presets name lofi, rain and storm, so custom tracks only get "Silence All".
+    default_presets = SILENCE_PRESETS if "tracks" in cfg else DEFAULT_PRESETS
+    return build_track_registry(cfg.get("tracks", DEFAULT_TRACKS), cfg.get("presets", default_presets))
+
 # --- Internet Check ---
 def check_internet_connection(host="8.8.8.8", port=53, timeout=2):
-    original_timeout = socket.getdefaulttimeout()
+    import socket
     try:
-        socket.setdefaulttimeout(timeout)
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.connect((host, port))
-        s.close()
+        socket.create_connection((host, port), timeout).close()
         return True
-    except socket.error:
+    except OSError:
         return False
-    finally:
-        socket.setdefaulttimeout(original_timeout)
 
 # --- MPV Control Functions ---
 def start_mpv_instance(sound_type_key, sound_states, mpv_processes):
     params = sound_states[sound_type_key]
     media_source = params["media"]
     ipc_socket = params["socket"]
+    kind = TRACK_KINDS[params["kind"]]
 
-    sound_states[sound_type_key]["_file_not_found"] = False
-    sound_states[sound_type_key]["_mpv_not_found"] = False
-    if sound_type_key == "lofi":
-        sound_states[sound_type_key]["_no_internet"] = False
+    params["_file_not_found"] = False
+    params["_mpv_not_found"] = False
+    params["_no_internet"] = False
 
-    if sound_type_key != "lofi" and not os.path.exists(media_source):
-        sound_states[sound_type_key]["is_running"] = False
-        sound_states[sound_type_key]["_file_not_found"] = True
+    if kind["needs_file"] and not os.path.exists(media_source):
+        params["is_running"] = False
+        params["_file_not_found"] = True
         return None
 
-    if sound_type_key == "lofi":
+    if kind["needs_internet"]:
         if not check_internet_connection():
-            sound_states[sound_type_key]["is_running"] = False
-            sound_states[sound_type_key]["_no_internet"] = True
+            params["is_running"] = False
+            params["_no_internet"] = True
             return None
 
     if os.path.exists(ipc_socket):
@@ -107,19 +287,16 @@ def start_mpv_instance(sound_type_key, sound_states, mpv_processes):
             pass
 
     command = ["mpv", f"--input-ipc-server={ipc_socket}", "--vo=null", "--video=no", "--no-terminal",
-               "--force-window=no", f"--volume={sound_states[sound_type_key]['volume']}", media_source]
-    if sound_type_key == "lofi":
-        command.extend(["--idle=yes", "--loop-file=no"])
-    else:
-        command.append("--loop-file=inf")
+               "--force-window=no", f"--volume={params['volume']}", media_source]
+    command.extend(kind["mpv_args"])
 
+    import subprocess
     try:
         process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         mpv_processes[sound_type_key] = process
         sound_states[sound_type_key]["is_running"] = True
 
-        socket_wait_retries = 30 if sound_type_key == "lofi" else 20
-        for _ in range(socket_wait_retries):
+        for _ in range(kind["socket_wait_retries"]):
             if os.path.exists(ipc_socket):
                 is_paused = not sound_states[sound_type_key]["playing"]
                 if is_paused:
@@ -148,6 +325,8 @@ def start_mpv_instance(sound_type_key, sound_states, mpv_processes):
 def send_mpv_command(ipc_socket, command_obj):
     if not os.path.exists(ipc_socket):
         return {"error": "socket not found"}
+    import json
+    import socket
     try:
         cs=socket.socket(socket.AF_UNIX,socket.SOCK_STREAM)
         cs.settimeout(0.2)
@@ -160,6 +339,35 @@ def send_mpv_command(ipc_socket, command_obj):
     except Exception as e:
         return {"error": str(e)}
 
+def get_mpv_property(ipc_socket, name):
+    if not os.path.exists(ipc_socket):
+        return {"error": "socket not found"}
+    import json
+    import socket
+    try:
+        cs=socket.socket(socket.AF_UNIX,socket.SOCK_STREAM)
+        cs.settimeout(0.2)
+        cs.connect(ipc_socket)
+        cs.sendall(json.dumps({"command":["get_property",name],"request_id":1}).encode('utf-8')+b'\n')
+        buf=b""
+        while True:
+            chunk=cs.recv(4096)
+            if not chunk:
+                break
+            buf+=chunk
+            while b'\n' in buf:
+                line,buf=buf.split(b'\n',1)
+                reply=json.loads(line)
+                if reply.get("request_id")==1: # skip async event lines
+                    cs.close()
+                    return {"status": "success", "data": reply.get("data")} if reply.get("error")=="success" else {"error": reply.get("error")}
+        cs.close()
+        return {"error": "no reply"}
+    except socket.timeout:
+        return {"error": "timeout"}
+    except Exception as e:
+        return {"error": str(e)}
+
 def set_sound_state(stype, play_target, vol_target, s_states, mpv_procs):
     state = s_states[stype]
     original_playing_state = state.get("playing", False)
@@ -174,25 +382,25 @@ def set_sound_state(stype, play_target, vol_target, s_states, mpv_procs):
             if not state.get("is_running", False):
                 state["playing"] = original_playing_state
                 state["volume"] = original_volume
-                if stype == "lofi" and state.get("_no_internet"):
-                    return "Lofi: No internet connection."
+                if state.get("_no_internet"):
+                    return f"{state['label']}: No internet connection."
                 if state.get("_mpv_not_found"):
-                    return f"{stype.capitalize()}: mpv not found."
+                    return f"{state['label']}: mpv not found."
                 if state.get("_file_not_found"):
-                    return f"{stype.capitalize()}: File not found."
-                return f"{stype.capitalize()} failed to start."
-            return f"{stype.capitalize()} starting..."
+                    return f"{state['label']}: File not found."
+                return f"{state['label']} failed to start."
+            return f"{state['label']} starting..."
         else:
-            return f"{stype.capitalize()} state set (offline)."
+            return f"{state['label']} state set (offline)."
 
     send_mpv_command(state["socket"],{"command":["set_property","volume",vol_target]})
     target_mpv_pause_state = not play_target
     send_mpv_command(state["socket"],{"command":["set_property","pause",target_mpv_pause_state]})
 
     if play_target:
-        return f"{stype.capitalize()} set to play (vol: {vol_target}%)."
+        return f"{state['label']} set to play (vol: {vol_target}%)."
     else:
-        return f"{stype.capitalize()} set to pause/stop (vol: {vol_target}%)."
+        return f"{state['label']} set to pause/stop (vol: {vol_target}%)."
 
 
 def toggle_play_pause(stype, s_states, mpv_procs):
@@ -204,9 +412,9 @@ def toggle_play_pause(stype, s_states, mpv_procs):
         res = send_mpv_command(state["socket"], {"command": ["set_property", "pause", mpv_pause_command]})
         if res.get("status") == "success":
             state["playing"] = new_desired_play_state
-            return f"{stype.capitalize()}: {'Playing' if state['playing'] else 'Paused'}"
+            return f"{state['label']}: {'Playing' if state['playing'] else 'Paused'}"
         else:
-            return f"Err Toggling {stype.capitalize()}:{res.get('error','Unk')[:15]}"
+            return f"Err Toggling {state['label']}:{res.get('error','Unk')[:15]}"
     else:
         return set_sound_state(stype, new_desired_play_state, state["volume"], s_states, mpv_procs)
 
@@ -217,22 +425,78 @@ def adjust_volume(stype, change, s_states):
     state["volume"]=new_vol
 
     if not state.get("is_running",False):
-        return f"{stype.capitalize()} Vol set to {new_vol}% (offline)."
+        return f"{state['label']} Vol set to {new_vol}% (offline)."
 
     res=send_mpv_command(state["socket"],{"command":["set_property","volume",new_vol]})
     if res.get("status")=="success":
-        return f"{stype.capitalize()} Vol {'+'if change>0 else ''}{change}% ({new_vol}%)"
-    return f"Err {stype.capitalize()} Vol:{res.get('error','Unk')[:15]}"
+        return f"{state['label']} Vol {'+'if change>0 else ''}{change}% ({new_vol}%)"
+    return f"Err {state['label']} Vol:{res.get('error','Unk')[:15]}"
 
-def apply_preset(pkey, s_states, mpv_procs):
-    if pkey not in SOUND_PRESETS:
+def apply_preset(pkey, presets, s_states, mpv_procs):
+    if pkey not in presets:
         return "Invalid preset."
-    preset=SOUND_PRESETS[pkey]
-    for stype,settings in preset["settings"].items():
-        if stype in s_states:
-            set_sound_state(stype, settings["playing"], settings["volume"], s_states, mpv_procs)
+    preset=presets[pkey]
+    for stype,playing,volume in preset["settings"]:
+        set_sound_state(stype, playing, s_states[stype]["volume"] if volume is None else volume, s_states, mpv_procs)
     return f"Preset '{preset['name']}' applied."
 
+def is_failure_msg(msg):
+    return any(marker in msg for marker in ("failed", "No internet", "not found", "Err "))
+
+def start_initial_audio(s_states, mpv_procs, fb_msg, startup=None):
+    for ks_init in [k for k,st in s_states.items() if TRACK_KINDS[st["kind"]]["needs_file"]]:
+        if not os.path.exists(s_states[ks_init]["media"]):
+            try:
+                with open(s_states[ks_init]["media"],'a') as f:
+                    if os.path.getsize(s_states[ks_init]["media"]) == 0:
+                         fb_msg += f" {s_states[ks_init]['label']} file created."
+            except OSError:
+                fb_msg += f" Err creating {ks_init} file."
+                pass
+
+    for st_k_init_mpv, state_vals in s_states.items():
+        if startup is not None and startup["cancel"]:
+            state_vals["_starting"] = False
+            continue
+        if state_vals["playing"]:
+            initial_fb = set_sound_state(st_k_init_mpv, True, state_vals["volume"], s_states, mpv_procs)
+            if is_failure_msg(initial_fb):
+                fb_msg = initial_fb
+            elif fb_msg.startswith("Welcome"):
+                fb_msg = initial_fb
+        state_vals["_starting"] = False
+    return fb_msg
+
+# startup_procs maps each launch track that came up to its mpv process; a track the user restarts
+# by key gets a new process and is no longer polled, so only launch playback is measured.
+def wait_for_first_audio(s_states, mpv_procs, startup_procs, startup):
+    deadline=time.monotonic()+STARTUP_AUDIO_WAIT_S
+    while startup_procs and not startup["cancel"] and time.monotonic()<deadline:
+        for name,proc in startup_procs.items():
+            state=s_states[name]
+            if mpv_procs.get(name) is proc and state["playing"] and state.get("is_running",False):
+                res=get_mpv_property(state["socket"],"core-idle")
+                if res.get("status")=="success" and res.get("data") is False:
+                    _mark_startup("first_audio")
+                    return
+        time.sleep(0.1)
+
+def _run_initial_audio(s_states, mpv_procs, fb_msg, startup, startup_tracks, start_audio, profile):
+    try:
+        if start_audio:
+            fb_msg = start_initial_audio(s_states, mpv_procs, fb_msg, startup)
+    except Exception as e:
+        fb_msg = f"Audio startup failed: {str(e)[:30]}"
+    finally:
+        for state in s_states.values():
+            state["_starting"] = False
+        startup["fb_msg"] = fb_msg
+        startup["done"] = True
+    if profile:
+        startup_procs = {name: mpv_procs[name] for name in startup_tracks
+                         if s_states[name].get("is_running", False) and name in mpv_procs}
+        wait_for_first_audio(s_states, mpv_procs, startup_procs, startup)
+
 
 # --- Curses UI Functions ---
 def get_volume_bar(volume, width):
@@ -244,12 +508,15 @@ def get_volume_bar(volume, width):
     empty_len = bar_chars_width - filled_len
     return f"[{'█' * filled_len}{'─' * empty_len}]"
 
-def draw_track_info_line(stdscr, y, name, state, w, c_main, c_err):
+def draw_track_info_line(stdscr, y, name, state, w, c_main, c_err, label_w=7):
     try:
         sym = "▶ " if state["playing"] else "❚❚"
         lcol = c_main
         xtra = ""
-        if not state.get("is_running", False):
+        if state.get("_starting"):
+            sym = "… "
+            xtra = "(Starting...)"
+        elif not state.get("is_running", False):
             sym = "✖ "
             lcol = c_err
             if state.get("_file_not_found"): xtra=f"(File {os.path.basename(state['media'])} nf)"
@@ -260,7 +527,7 @@ def draw_track_info_line(stdscr, y, name, state, w, c_main, c_err):
             else: xtra="(Not Run)"
 
         vol_percent_str = f"{state['volume']:>3}%"
-        part1 = f"  {name.upper():<7} {sym} {vol_percent_str} "
+        part1 = f"  {name.upper():<{label_w}} {sym} {vol_percent_str} "
         remaining_width_for_bar_and_extra = w - 2 - len(part1)
 
         extra_len_with_space = len(xtra) + (1 if xtra else 0)
@@ -305,7 +572,56 @@ def _generate_lightning_bolt(anim_width, anim_height):
                     branches +=1
     return points
 
-def update_and_draw_animations(stdscr,y_s,a_h,x_s,a_w,s_s,anim_s,c_cfg):
+def _animate_lightning(stdscr,y_s,a_h,x_s,a_w,state,anim,c_cfg):
+    sc=curses.color_pair(c_cfg["lightning"])
+    if anim.get("lightning_bolt"):
+        for lx,ly,lc in anim["lightning_bolt"]["points"]:
+            _draw_char_safe(stdscr,y_s+ly,x_s+lx,lc,sc)
+        anim["lightning_bolt"]["frames_left"]-=1
+        if anim["lightning_bolt"]["frames_left"]<=0:
+            anim["lightning_bolt"]=None
+    elif random.random()<LIGHTNING_CHANCE and a_w>0 and a_h>=MIN_ANIMATION_H:
+        anim["lightning_bolt"]={"points":_generate_lightning_bolt(a_w,a_h),"frames_left":LIGHTNING_DURATION_FRAMES}
+
+def _animate_rain(stdscr,y_s,a_h,x_s,a_w,state,anim,c_cfg):
+    rc=curses.color_pair(c_cfg["rain"])
+    nd=[(x,y+1,c) for x,y,c in anim.get("rain_drops",[]) if y+1<a_h]
+    anim["rain_drops"]=nd
+    v=state["volume"]
+    f=0 if v<=50 else (v-50)/50.0
+    nn=int(MIN_NEW_RAIN_DROPS_PER_FRAME+f*(MAX_NEW_RAIN_DROPS_PER_FRAME-MIN_NEW_RAIN_DROPS_PER_FRAME))
+    nnd=random.randint(min(nn,MAX_NEW_RAIN_DROPS_PER_FRAME//2),nn)
+    mt=int(a_w*MAX_RAIN_DROPS_PER_WIDTH_UNIT)
+    syl=max(1,int(a_h*RAIN_SPAWN_Y_PERCENT))
+    for _ in range(nnd):
+        if len(anim["rain_drops"])<mt and a_w>0:
+            anim["rain_drops"].append((random.randint(0,a_w-1),random.randint(0,syl-1),random.randint(0,len(RAIN_CHARS)-1)))
+    for x,y,c in anim["rain_drops"]:
+        _draw_char_safe(stdscr,y_s+y,x_s+x,RAIN_CHARS[c],rc)
+
+def _animate_notes(stdscr,y_s,a_h,x_s,a_w,state,anim,c_cfg):
+    lc = curses.color_pair(c_cfg["feedback"]) | curses.A_BOLD # Use feedback color (white) and make it BOLD
+    nnl=[]
+    for x,y,c,d in anim.get("music_notes",[]):
+        ny,ndf = y-NOTE_FLOAT_SPEED,d+NOTE_FLOAT_SPEED
+        if ndf<NOTE_MAX_FLOAT_LINES and ny>=0:
+            nnl.append((x,ny,c,ndf))
+    anim["music_notes"]=nnl
+    mn=int(a_w*MAX_NOTES_PER_WIDTH_UNIT)
+    if random.random()<0.15 and len(anim["music_notes"])<mn and a_w>0 and a_h>0:
+        anim["music_notes"].append((random.randint(0,a_w-1),a_h-1,random.randint(0,len(NOTE_CHARS)-1),0))
+    for x,y,c,_ in anim["music_notes"]:
+        if 0<=int(y)<a_h:
+            _draw_char_safe(stdscr,y_s+int(y),x_s+x,NOTE_CHARS[c],lc)
+
+# Animation hooks a track can name in its "animation" field; drawn back to front in this order.
+ANIMATION_HOOKS = {
+    "lightning": _animate_lightning,
+    "rain": _animate_rain,
+    "notes": _animate_notes,
+}
+
+def update_and_draw_animations(stdscr,y_s,a_h,x_s,a_w,s_s,anim_s,c_cfg,animated):
     if a_w <= 0 or a_h <= 0:
         return
     for i in range(a_h):
@@ -313,58 +629,21 @@ def update_and_draw_animations(stdscr,y_s,a_h,x_s,a_w,s_s,anim_s,c_cfg):
             stdscr.addstr(y_s + i, x_s, " " * a_w)
         except curses.error:
             pass
-    if s_s["storm"]["playing"] and s_s["storm"].get("is_running", False):
-        sc=curses.color_pair(c_cfg["lightning"])
-        if anim_s["lightning_bolt"]:
-            for lx,ly,lc in anim_s["lightning_bolt"]["points"]:
-                _draw_char_safe(stdscr,y_s+ly,x_s+lx,lc,sc)
-            anim_s["lightning_bolt"]["frames_left"]-=1
-            if anim_s["lightning_bolt"]["frames_left"]<=0:
-                anim_s["lightning_bolt"]=None
-        elif random.random()<LIGHTNING_CHANCE and a_w>0 and a_h>=MIN_ANIMATION_H:
-            anim_s["lightning_bolt"]={"points":_generate_lightning_bolt(a_w,a_h),"frames_left":LIGHTNING_DURATION_FRAMES}
-
-    if s_s["rain"]["playing"] and s_s["rain"].get("is_running", False):
-        rc=curses.color_pair(c_cfg["rain"])
-        nd=[(x,y+1,c) for x,y,c in anim_s["rain_drops"] if y+1<a_h]
-        anim_s["rain_drops"]=nd
-        v=s_s["rain"]["volume"]
-        f=0 if v<=50 else (v-50)/50.0
-        nn=int(MIN_NEW_RAIN_DROPS_PER_FRAME+f*(MAX_NEW_RAIN_DROPS_PER_FRAME-MIN_NEW_RAIN_DROPS_PER_FRAME))
-        nnd=random.randint(min(nn,MAX_NEW_RAIN_DROPS_PER_FRAME//2),nn)
-        mt=int(a_w*MAX_RAIN_DROPS_PER_WIDTH_UNIT)
-        syl=max(1,int(a_h*RAIN_SPAWN_Y_PERCENT))
-        for _ in range(nnd):
-            if len(anim_s["rain_drops"])<mt and a_w>0:
-                anim_s["rain_drops"].append((random.randint(0,a_w-1),random.randint(0,syl-1),random.randint(0,len(RAIN_CHARS)-1)))
-        for x,y,c in anim_s["rain_drops"]:
-            _draw_char_safe(stdscr,y_s+y,x_s+x,RAIN_CHARS[c],rc)
-
-    if s_s["lofi"]["playing"] and s_s["lofi"].get("is_running", False):
-        lc = curses.color_pair(c_cfg["feedback"]) | curses.A_BOLD # Use feedback color (white) and make it BOLD
-        nnl=[]
-        for x,y,c,d in anim_s["music_notes"]:
-            ny,ndf = y-NOTE_FLOAT_SPEED,d+NOTE_FLOAT_SPEED
-            if ndf<NOTE_MAX_FLOAT_LINES and ny>=0:
-                nnl.append((x,ny,c,ndf))
-        anim_s["music_notes"]=nnl
-        mn=int(a_w*MAX_NOTES_PER_WIDTH_UNIT)
-        if random.random()<0.15 and len(anim_s["music_notes"])<mn and a_w>0 and a_h>0:
-            anim_s["music_notes"].append((random.randint(0,a_w-1),a_h-1,random.randint(0,len(NOTE_CHARS)-1),0))
-        for x,y,c,_ in anim_s["music_notes"]:
-            if 0<=int(y)<a_h:
-                _draw_char_safe(stdscr,y_s+int(y),x_s+x,NOTE_CHARS[c],lc)
-
-def draw_ui(stdscr, sound_states, feedback_message, h, w, animation_state, color_cfg, help_active):
+    for name,hook in animated:
+        state=s_s[name]
+        if state["playing"] and state.get("is_running", False):
+            hook(stdscr,y_s,a_h,x_s,a_w,state,anim_s[name],c_cfg)
+
+def draw_ui(stdscr, sound_states, feedback_message, h, w, animation_state, color_cfg, help_active, reg):
     stdscr.erase()
-    current_instructions_area_h = len(HELP_LINES_TEXT) if help_active else DEFAULT_INSTRUCTIONS_AREA_H
+    current_instructions_area_h = len(reg["help_lines"]) if help_active else DEFAULT_INSTRUCTIONS_AREA_H
 
     instructions_area_end_y = h - 2
     instructions_area_start_y = instructions_area_end_y - current_instructions_area_h + 1
 
     hline_above_instructions_y = instructions_area_start_y - 1
     track_info_end_y = hline_above_instructions_y -1
-    track_info_start_y = track_info_end_y - TRACK_INFO_H +1
+    track_info_start_y = track_info_end_y - len(reg["tracks"]) +1
     hline_above_tracks_y = track_info_start_y - TRACK_INFO_HLINE_H
     title_y = 0
     anim_y_start = title_y + TITLE_H
@@ -400,15 +679,12 @@ def draw_ui(stdscr, sound_states, feedback_message, h, w, animation_state, color
     stdscr.attroff(border_color)
 
     if actual_anim_height >= MIN_ANIMATION_H and w > 2:
-        update_and_draw_animations(stdscr,anim_y_start,actual_anim_height,1,w-2,sound_states,animation_state,color_cfg)
+        update_and_draw_animations(stdscr,anim_y_start,actual_anim_height,1,w-2,sound_states,animation_state,color_cfg,reg["animated"])
 
     if track_info_start_y <= track_info_end_y and track_info_start_y > anim_y_start-1 and track_info_start_y < h -1 :
-        if track_info_start_y > 0:
-             draw_track_info_line(stdscr,track_info_start_y,"Lofi",sound_states["lofi"],w,color_cfg["main_text"],color_cfg["error"])
-        if track_info_start_y+1 > 0 and track_info_start_y+1 < h-1:
-             draw_track_info_line(stdscr,track_info_start_y+1,"Rain",sound_states["rain"],w,color_cfg["main_text"],color_cfg["error"])
-        if track_info_start_y+2 > 0 and track_info_start_y+2 < h-1:
-             draw_track_info_line(stdscr,track_info_start_y+2,"Storm",sound_states["storm"],w,color_cfg["main_text"],color_cfg["error"])
+        for i, track in enumerate(reg["tracks"]):
+            if track_info_start_y+i > 0 and track_info_start_y+i < h-1:
+                draw_track_info_line(stdscr,track_info_start_y+i,track["label"],sound_states[track["name"]],w,color_cfg["main_text"],color_cfg["error"],reg["label_w"])
 
     instr_color = curses.color_pair(color_cfg["main_text"])
     for i in range(current_instructions_area_h):
@@ -420,7 +696,7 @@ def draw_ui(stdscr, sound_states, feedback_message, h, w, animation_state, color
                 pass
 
     if help_active:
-        for i, line in enumerate(HELP_LINES_TEXT):
+        for i, line in enumerate(reg["help_lines"]):
             if i < current_instructions_area_h:
                 y_pos = instructions_area_start_y + i
                 if 0 < y_pos < h -1 and y_pos <= instructions_area_end_y and w > len(line) + 2:
@@ -431,8 +707,8 @@ def draw_ui(stdscr, sound_states, feedback_message, h, w, animation_state, color
                     except curses.error:
                         pass
     else:
-        main_instr_text = "[L/O/K]Lofi [R/E/D]Rain [S/T/G]Storm [H]Help [Q]Quit"
-        preset_instr_text = "Presets: [1]Chill [2]Storm [3]LofiOnly [0]Silence"
+        main_instr_text = fit_text(reg["main_instr_variants"], w-3)
+        preset_instr_text = fit_text(reg["preset_instr_variants"], w-3)
         instr_y1 = instructions_area_start_y
         instr_y2 = instructions_area_start_y + 1
         feedback_line_y = instructions_area_start_y + 2
@@ -460,7 +736,7 @@ def draw_ui(stdscr, sound_states, feedback_message, h, w, animation_state, color
             except curses.error:
                 pass
 
-def draw_minimal_ui(stdscr, feedback_message, h, w, color_cfg):
+def draw_minimal_ui(stdscr, feedback_message, h, w, color_cfg, reg):
     stdscr.erase()
     line_idx = 0
     try:
@@ -490,19 +766,16 @@ def draw_minimal_ui(stdscr, feedback_message, h, w, color_cfg):
     instr_sy=line_idx; instr_ey=fb_y-1 if can_fb else h-1
     try:
         if instr_sy <= instr_ey:
-            instr_texts = ["[LOK]Lofi [RED]Rain [STG]Storm [H]Help [Q]Quit", "Presets: [1][2][3][0]"]
-            total_ih=len(instr_texts); avail_ih=instr_ey-instr_sy+1;
+            instr_variants = [v for v in (reg["main_instr_variants"][1:], reg["preset_instr_variants"][1:]) if v]
+            total_ih=len(instr_variants); avail_ih=instr_ey-instr_sy+1;
             sdy = instr_sy + max(0, (avail_ih - total_ih) // 2)
 
-            for i,txt in enumerate(instr_texts):
+            for i,variants in enumerate(instr_variants):
                 if i>=avail_ih: break
                 cur_y=sdy+i
                 if cur_y < instr_sy or cur_y > instr_ey or cur_y >= h: continue
 
-                stxt=txt
-                if "Presets" in txt and w<len(txt)+4:stxt="Presets(1-3,0)"
-                elif w<len(txt)+4:stxt="Keys:LOK RED STG H Q"
-                chosen=txt if w>=len(txt)+4 else stxt
+                chosen=fit_text(variants, w-4)
 
                 if w > len(chosen)+2 :
                     stdscr.attron(curses.color_pair(color_cfg["main_text"]))
@@ -512,7 +785,7 @@ def draw_minimal_ui(stdscr, feedback_message, h, w, color_cfg):
     except curses.error:
         pass
 
-def main_curses(stdscr):
+def main_curses(stdscr, reg, sync_start=False, profile=False):
     curses.curs_set(0); stdscr.nodelay(True); stdscr.timeout(100)
     curses.start_color(); curses.use_default_colors()
 
@@ -538,46 +811,41 @@ def main_curses(stdscr):
 
 
     mpv_procs={}
-    s_states={ "lofi":{"playing":True,"volume":50,"socket":get_socket_path("lofi"),"media":LOFI_STREAM_URL},
-               "rain":{"playing":False,"volume":50,"socket":get_socket_path("rain"),"media":RAIN_SOUND_FILE},
-               "storm":{"playing":False,"volume":50,"socket":get_socket_path("storm"),"media":STORM_SOUND_FILE}}
+    s_states={t["name"]:{"playing":t["playing"],"volume":t["volume"],"socket":get_socket_path(t["name"]),
+                         "media":t["source"],"kind":t["kind"],"label":t["label"]} for t in reg["tracks"]}
     for k_init in s_states:
-        s_states[k_init].update({"is_running":False,"_file_not_found":False,"_mpv_not_found":False})
-        if k_init == "lofi":
-             s_states[k_init]["_no_internet"] = False
+        s_states[k_init].update({"is_running":False,"_file_not_found":False,"_mpv_not_found":False,"_no_internet":False})
 
-    anim_s={"rain_drops":[],"lightning_bolt":None,"music_notes":[]}
+    anim_s={name:{} for name,_ in reg["animated"]}
+    actions={}
+    for k_act,(act,stype) in reg["keymap"].items():
+        if act=="toggle":
+            actions[k_act]=lambda t=stype:toggle_play_pause(t,s_states,mpv_procs)
+        else:
+            actions[k_act]=lambda t=stype,d=(VOLUME_STEP if act=="vol_up" else -VOLUME_STEP):adjust_volume(t,d,s_states)
     fb_msg="Welcome!"+fb_extra; fb_timer=30; help_active=False; help_timer=0
 
-    for ks_init in ["rain","storm"]:
-        if not os.path.exists(s_states[ks_init]["media"]):
-            try:
-                with open(s_states[ks_init]["media"],'a') as f:
-                    if os.path.getsize(s_states[ks_init]["media"]) == 0:
-                         fb_msg += f" {ks_init.capitalize()} file created."
-            except OSError:
-                fb_msg += f" Err creating {ks_init} file."
-                pass
-
-    for st_k_init_mpv, state_vals in s_states.items():
-        if state_vals["playing"]:
-            initial_fb = set_sound_state(st_k_init_mpv, True, state_vals["volume"], s_states, mpv_procs)
-            if "failed" in initial_fb or "No internet" in initial_fb or "not found" in initial_fb :
-                fb_msg = initial_fb
-            elif fb_msg.startswith("Welcome"):
-                fb_msg = initial_fb
+    # Deferred mode draws the first frame, then starts audio on a background thread;
+    # track and preset keys wait until that thread is done.
+    startup=None; startup_thread=None; startup_merged=False; first_frame_drawn=False
+    startup_tracks=[name for name,state_vals in s_states.items() if state_vals["playing"]]
+    if sync_start:
+        fb_msg = start_initial_audio(s_states, mpv_procs, fb_msg)
+    else:
+        for state_vals in s_states.values():
+            state_vals["_starting"] = state_vals["playing"]
 
+    min_h_base = TITLE_H + MIN_ANIMATION_H + TRACK_INFO_HLINE_H + len(reg["tracks"]) + 1
+    min_h_help = min_h_base + len(reg["help_lines"])
+    min_h_default = min_h_base + DEFAULT_INSTRUCTIONS_AREA_H
 
     while True:
-        h,w=stdscr.getmaxyx(); key=stdscr.getch()
+        h,w=stdscr.getmaxyx(); key=stdscr.getch() if first_frame_drawn else -1
 
         if key==curses.KEY_RESIZE:
             stdscr.clear()
 
-        current_min_instr_h = len(HELP_LINES_TEXT) if help_active else DEFAULT_INSTRUCTIONS_AREA_H
-        min_h_for_full_ui = (TITLE_H + MIN_ANIMATION_H + TRACK_INFO_HLINE_H +
-                             TRACK_INFO_H + 1 +
-                             current_min_instr_h)
+        min_h_for_full_ui = min_h_help if help_active else min_h_default
 
 
         if key!=-1 and key!=curses.KEY_RESIZE:
@@ -588,8 +856,8 @@ def main_curses(stdscr):
             if key==ord('q'):
                 fb_msg="Quitting...";
                 stdscr.erase()
-                if h<min_h_for_full_ui or w<MIN_FULL_UI_W:draw_minimal_ui(stdscr,fb_msg,h,w,ccfg)
-                else:draw_ui(stdscr,s_states,fb_msg,h,w,anim_s,ccfg,help_active)
+                if h<min_h_for_full_ui or w<MIN_FULL_UI_W:draw_minimal_ui(stdscr,fb_msg,h,w,ccfg,reg)
+                else:draw_ui(stdscr,s_states,fb_msg,h,w,anim_s,ccfg,help_active,reg)
                 stdscr.refresh();time.sleep(0.5);break
 
             if key==ord('h'):
@@ -599,18 +867,12 @@ def main_curses(stdscr):
             elif help_active and key != ord('h'):
                 help_active = False; help_timer = 0; fb_msg = "Help dismissed by key."; fb_timer = 20
 
-            if not help_active:
-                actions={'l':lambda:toggle_play_pause("lofi",s_states, mpv_procs),
-                         'o':lambda:adjust_volume("lofi",5,s_states),
-                         'k':lambda:adjust_volume("lofi",-5,s_states),
-                         'r':lambda:toggle_play_pause("rain",s_states, mpv_procs),
-                         'e':lambda:adjust_volume("rain",5,s_states),
-                         'd':lambda:adjust_volume("rain",-5,s_states),
-                         's':lambda:toggle_play_pause("storm",s_states, mpv_procs),
-                         't':lambda:adjust_volume("storm",5,s_states),
-                         'g':lambda:adjust_volume("storm",-5,s_states)}
-                if ck in SOUND_PRESETS:
-                    act=lambda c=ck:apply_preset(c,s_states,mpv_procs)
+            held=ck.lower() in reg["presets"] or (ck.lower() in reg["keymap"] and s_states[reg["keymap"][ck.lower()][1]].get("_starting"))
+            if not help_active and startup_thread and not startup["done"] and held:
+                fb_msg="Audio starting, please wait..."
+            elif not help_active:
+                if ck.lower() in reg["presets"]:
+                    act=lambda c=ck.lower():apply_preset(c,reg["presets"],s_states,mpv_procs)
                 else:
                     act=actions.get(ck.lower())
 
@@ -618,6 +880,11 @@ def main_curses(stdscr):
                 elif ck and fb_timer > 0 :
                     fb_timer = 1
 
+        if startup_thread and startup["done"] and not startup_merged and not help_active:
+            startup_merged=True
+            # Failures always show; other results keep any feedback shown meanwhile ("" = expired).
+            if is_failure_msg(startup["fb_msg"]) or fb_msg in (startup["fb_start"], ""): fb_msg=startup["fb_msg"]; fb_timer=30
+
         if help_active and help_timer > 0:
             help_timer -= 1
             if help_timer == 0: help_active = False; fb_msg = fb_msg or "Help timed out."; fb_timer = 20
@@ -625,8 +892,7 @@ def main_curses(stdscr):
             fb_timer -= 1
             if fb_timer == 0: fb_msg = ""
 
-        for stk_loop in list(s_states.keys()):
-            p_loop=mpv_procs.get(stk_loop)
+        for stk_loop,p_loop in list(mpv_procs.items()):
             if p_loop and p_loop.poll() is not None:
                 current_state = s_states[stk_loop]
                 was_intended_to_play = current_state["playing"]
@@ -634,7 +900,7 @@ def main_curses(stdscr):
 
                 current_state.update({"is_running":False,"playing":False})
 
-                if stk_loop == "lofi" and was_intended_to_play and was_actually_running:
+                if TRACK_KINDS[current_state["kind"]]["needs_internet"] and was_intended_to_play and was_actually_running:
                     if not check_internet_connection(timeout=1):
                         current_state["_no_internet"] = True
 
@@ -645,11 +911,27 @@ def main_curses(stdscr):
 
 
         if h<min_h_for_full_ui or w<MIN_FULL_UI_W:
-            draw_minimal_ui(stdscr,fb_msg,h,w,ccfg)
+            draw_minimal_ui(stdscr,fb_msg,h,w,ccfg,reg)
         else:
-            draw_ui(stdscr,s_states,fb_msg,h,w,anim_s,ccfg,help_active)
+            draw_ui(stdscr,s_states,fb_msg,h,w,anim_s,ccfg,help_active,reg)
         stdscr.refresh()
 
+        if not first_frame_drawn:
+            first_frame_drawn=True
+            _mark_startup("first_frame")
+            if not sync_start or profile:
+                startup={"cancel":False,"done":False,"fb_start":fb_msg,"fb_msg":fb_msg}
+                import threading
+                startup_thread=threading.Thread(target=_run_initial_audio,daemon=True,
+                                                         args=(s_states,mpv_procs,fb_msg,startup,startup_tracks,not sync_start,profile))
+                startup_thread.start()
+
+    if startup_thread:
+        startup["cancel"]=True
+        startup_thread.join()
+
+    if mpv_procs:
+        import subprocess
     for sk_cleanup,p_cleanup in mpv_procs.items():
         if p_cleanup and p_cleanup.poll() is None:
             if os.path.exists(s_states[sk_cleanup]["socket"]):
@@ -665,12 +947,47 @@ def main_curses(stdscr):
             try: os.remove(s_states[stk_final_cleanup]["socket"])
             except OSError: pass
 
+USAGE = """usage: rainylofi.py [-h] [--sync-start] [--startup-profile [LOG_FILE]]
+
+  --sync-start                  start audio before drawing the first frame (the old startup behaviour)
+  --startup-profile [LOG_FILE]  on exit, report time from module load (interpreter start-up excluded)
+                                to first frame and to first audio (mpv reporting playback of a track
+                                set to play at launch); optionally append it as a JSON line to LOG_FILE"""
+
+# Parsed by hand: argparse costs more import time than the rest of startup before the first frame.
+def parse_args(argv):
+    args = {"sync_start": False, "startup_profile": None}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ("-h", "--help"):
+            print(USAGE); sys.exit(0)
+        elif arg == "--sync-start":
+            args["sync_start"] = True
+        elif arg == "--startup-profile":
+            args["startup_profile"] = ""
+            if i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+                i += 1
+                args["startup_profile"] = argv[i]
+        elif arg.startswith("--startup-profile="):
+            args["startup_profile"] = arg.split("=", 1)[1]
+        else:
+            print(f"{USAGE}\nrainylofi.py: error: unrecognized argument {arg}"); sys.exit(2)
+        i += 1
+    return args
+
 if __name__=="__main__":
+    args = parse_args(sys.argv[1:])
+
     if not os.path.exists(SOCKET_DIR):
         try: os.makedirs(SOCKET_DIR,exist_ok=True)
         except OSError as e: print(f"Error creating socket directory {SOCKET_DIR}:{e}");sys.exit(1)
     try:
-        curses.wrapper(main_curses)
+        track_registry=load_track_registry()
+    except (OSError, ValueError) as e:
+        print(f"Error loading track config {TRACKS_CONFIG_FILE}:{e}");sys.exit(1)
+    try:
+        curses.wrapper(main_curses, track_registry, args["sync_start"], args["startup_profile"] is not None)
     except curses.error as e:
         print(f"Curses error: {e}")
         print("If on Windows, ensure you have 'windows-curses' installed (pip install windows-curses).")
@@ -681,3 +998,5 @@ if __name__=="__main__":
         traceback.print_exc()
     finally:
         print(f"{PLAYER_TITLE} closed.")
+        if args["startup_profile"] is not None:
+            report_startup_profile("sync" if args["sync_start"] else "deferred", args["startup_profile"])